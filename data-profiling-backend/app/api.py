@@ -3,7 +3,6 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from typing import List
 import uuid
-import chardet
 import os
 from datetime import datetime
 from pathlib import Path
@@ -12,7 +11,7 @@ from app.models import (
     DatasetProfile, ColumnStats
 )
 from app.config import settings
-from app.profiler import CSVProfiler
+from app.profiler import CSVProfiler, detect_encoding_bytes, detect_file_encoding
 
 router = APIRouter()
 
@@ -44,9 +43,8 @@ async def upload_file(file: UploadFile = File(...)):
     # Read file content for encoding detection
     content = await file.read()
     
-    # Detect file encoding
-    detected = chardet.detect(content)
-    encoding = detected['encoding'] if detected['encoding'] else 'UTF-8'
+    # Detect file encoding from the leading bytes only
+    encoding = detect_encoding_bytes(content)
     
     # Save file
     with open(file_path, 'wb') as f:
@@ -199,10 +197,7 @@ async def preview_file(
     
     try:
         # Detect encoding
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-            encoding = result['encoding'] if result['encoding'] else 'utf-8'
+        encoding = detect_file_encoding(file_path)
         
         # Read CSV with detected encoding
         headers = []
@@ -4,11 +4,40 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import chardet
+import codecs
+import io
+import os
 import re
-from collections import Counter
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from itertools import combinations
+
+try:
+    import pyarrow as pa  # Arrow string columns and their byte buffers
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+STRING_DTYPE = "string[pyarrow]" if PYARROW_AVAILABLE else "string"
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from app.models import (
     ColumnStats, DatasetProfile, CSVConfig, Rulesets,
     NumericStats, StringStats, DateTimeStats, ColumnQualityMetrics,
@@ -17,6 +46,288 @@ from app.models import (
 )
 
 
+def physical_memory_bytes() -> Optional[int]:
+    """Total physical memory in bytes, or None if the platform does not report it"""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+# Peak bytes a full profile holds per byte of CSV: the C parser's buffers and
+# Python string objects (about 5x for text-heavy files) plus the analyzers' copies
+PROFILE_MEMORY_FACTOR = 10
+
+
+def count_nulls(series: pd.Series) -> int:
+    """Null count read from Arrow validity metadata or the dtype where possible"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype) or (isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"):
+        # O(1): Arrow tracks the null count alongside the validity bitmap
+        return series.array.__arrow_array__().null_count
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iub':
+        # Plain numpy integer/boolean columns cannot hold nulls
+        return 0
+    return int(series.isna().sum())
+
+
+# Leading bytes of a file inspected for encoding detection
+ENCODING_SAMPLE_BYTES = 65536
+
+
+def detect_encoding_bytes(raw_data: bytes) -> str:
+    """Detect the encoding of a file from its leading bytes"""
+    raw_data = raw_data[:ENCODING_SAMPLE_BYTES]
+    
+    # A BOM or a valid UTF-8 prefix settles it without running chardet
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if raw_data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        # Incremental decode tolerates a multi-byte character cut at the sample boundary
+        codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    result = chardet.detect(raw_data)
+    return result['encoding'] if result['encoding'] else 'utf-8'
+
+
+@lru_cache(maxsize=128)
+def _cached_file_encoding(path: str, mtime_ns: int, size: int) -> str:
+    """Encoding of a file version; mtime and size are part of the key so edits invalidate it"""
+    with open(path, 'rb') as f:
+        return detect_encoding_bytes(f.read(ENCODING_SAMPLE_BYTES))
+
+
+def detect_file_encoding(file_path) -> str:
+    """Detect the encoding of a file, reusing the result while the file is unchanged"""
+    stat = os.stat(file_path)
+    return _cached_file_encoding(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class ColumnContext:
+    """Per-column values computed once and shared by every analyzer"""
+    series: pd.Series
+    non_null: pd.Series
+    value_counts: pd.Series  # unsorted; use _top_counts for ranked entries
+    kind: str  # numpy dtype kind code; Arrow/nullable string dtypes report 'O'
+    
+    @property
+    def is_numeric(self) -> bool:
+        return self.kind in 'iufcb'
+    
+    @property
+    def is_string(self) -> bool:
+        return self.kind in 'OSU'
+    
+    @property
+    def null_count(self) -> int:
+        return len(self.series) - len(self.non_null)
+    
+    @cached_property
+    def non_null_str(self) -> pd.Series:
+        """Non-null values as Python strings, built on first use"""
+        return self.non_null.astype(str)
+    
+    @cached_property
+    def non_null_float(self) -> np.ndarray:
+        """Non-null numeric values as one float64 array shared by the numeric analyzers"""
+        return self.non_null.to_numpy(dtype=np.float64)
+
+
+def _fast_quantiles(arr: np.ndarray, qs: List[float]) -> np.ndarray:
+    """Linearly interpolated quantiles of a null-free array via quickselect"""
+    positions = np.asarray(qs, dtype=float) * (len(arr) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    partitioned = np.partition(arr, np.unique(np.concatenate([lower, upper])))
+    lower_values = partitioned[lower]
+    return lower_values + (partitioned[upper] - lower_values) * (positions - lower)
+
+
+def _top_counts(value_counts: pd.Series, k: int, ascending: bool = False) -> pd.Series:
+    """k most (or least) frequent entries of unsorted value counts without a full sort"""
+    counts = value_counts.to_numpy()
+    keys = counts if ascending else -counts
+    if len(keys) > k:
+        selected = np.argpartition(keys, k - 1)[:k]
+        order = selected[np.argsort(keys[selected], kind='stable')]
+    else:
+        order = np.argsort(keys, kind='stable')
+    return value_counts.iloc[order]
+
+
+# Byte classes for the fused character-set pass; bytes >= 0x80 belong to
+# multi-byte UTF-8 characters, whose rows fall back to the str predicates
+CHAR_ALPHA, CHAR_DIGIT, CHAR_SPACE, CHAR_SPECIAL, CHAR_NON_ASCII = 1, 2, 4, 8, 16
+
+
+def _ascii_char_class(char: str) -> int:
+    """Class bits of one ASCII character, matching the str predicates"""
+    if char.isalpha():
+        return CHAR_ALPHA
+    if char.isdigit():
+        return CHAR_DIGIT
+    if char.isspace():
+        return CHAR_SPACE
+    return CHAR_SPECIAL
+
+
+CHAR_CLASS_LUT = np.array(
+    [_ascii_char_class(chr(code)) for code in range(128)] + [CHAR_NON_ASCII] * 128,
+    dtype=np.uint8
+)
+
+
+def _byte_class_flags(values: pd.Series) -> Dict[str, np.ndarray]:
+    """Length and character-class flags per string from one LUT pass over its UTF-8
+    bytes; rows containing non-ASCII bytes are marked 'non_ascii' and left unset"""
+    arr = pa.array(values, type=pa.large_string())
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.empty(0, np.uint8)
+    
+    lengths = np.diff(offsets)
+    nonempty = lengths > 0
+    starts = offsets[:-1][nonempty]
+    first_bits = np.zeros(len(arr), dtype=np.uint8)
+    last_bits = np.zeros(len(arr), dtype=np.uint8)
+    first_bits[nonempty] = CHAR_CLASS_LUT[data[starts]]
+    last_bits[nonempty] = CHAR_CLASS_LUT[data[starts + lengths[nonempty] - 1]]
+    if NUMBA_AVAILABLE and len(arr) > NUMBA_MIN_ROWS:
+        with _NUMBA_LOCK:
+            any_bits, all_bits = _byte_class_bits(data, offsets, CHAR_CLASS_LUT)
+    else:
+        any_bits = np.zeros(len(arr), dtype=np.uint8)
+        all_bits = np.zeros(len(arr), dtype=np.uint8)
+        if len(starts) > 0:
+            # Empty rows are excluded so every reduceat segment is exactly one string
+            classes = CHAR_CLASS_LUT[data[offsets[0]:offsets[-1]]]
+            any_bits[nonempty] = np.bitwise_or.reduceat(classes, starts - offsets[0])
+            all_bits[nonempty] = np.bitwise_and.reduceat(classes, starts - offsets[0])
+    
+    return {
+        'non_ascii': (any_bits & CHAR_NON_ASCII) > 0,
+        'length': lengths,
+        'empty': ~nonempty,
+        'whitespace_only': (all_bits & CHAR_SPACE) > 0,
+        'leading_spaces': (first_bits & CHAR_SPACE) > 0,
+        'trailing_spaces': (last_bits & CHAR_SPACE) > 0,
+        'alphanumeric': nonempty & ((any_bits & (CHAR_SPACE | CHAR_SPECIAL)) == 0),
+        'alpha_only': any_bits == CHAR_ALPHA,
+        'numeric_only': any_bits == CHAR_DIGIT,
+        'special_chars': (any_bits & CHAR_SPECIAL) > 0,
+    }
+
+
+# Columns above this size use the fused Numba kernels for numeric moments and
+# string character classes
+NUMBA_MIN_ROWS = 1_000_000
+
+# The parallel kernels are called from the column thread pool, and Numba's default
+# workqueue threading layer aborts the process on concurrent launches; one kernel
+# runs at a time (each already spans every core)
+_NUMBA_LOCK = threading.Lock()
+
+if NUMBA_AVAILABLE:
+    # Only reassociation/contraction are relaxed so inf values still compare correctly
+    @njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+    def _numeric_moments(arr, shift, lower, upper):
+        """One pass over a null-free float64 array: shifted sums, min, max and IQR outliers"""
+        total = 0.0
+        total_sq = 0.0
+        min_val = np.inf
+        max_val = -np.inf
+        outliers = 0
+        for i in prange(arr.shape[0]):
+            value = arr[i]
+            delta = value - shift
+            total += delta
+            total_sq += delta * delta
+            min_val = min(min_val, value)
+            max_val = max(max_val, value)
+            if value < lower or value > upper:
+                outliers += 1
+        return total, total_sq, min_val, max_val, outliers
+    
+    @njit(parallel=True, cache=True)
+    def _byte_class_bits(data, offsets, lut):
+        """One pass over Arrow string buffers: per-string OR and AND of byte classes"""
+        n = offsets.shape[0] - 1
+        any_bits = np.zeros(n, dtype=np.uint8)
+        all_bits = np.zeros(n, dtype=np.uint8)
+        for i in prange(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            if end > start:
+                acc_any = np.uint8(0)
+                acc_all = np.uint8(0xFF)
+                for j in range(start, end):
+                    bits = lut[data[j]]
+                    acc_any |= bits
+                    acc_all &= bits
+                any_bits[i] = acc_any
+                all_bits[i] = acc_all
+        return any_bits, all_bits
+    
+    @njit(parallel=True, cache=True)
+    def _histogram_counts(arr, edges, n_chunks):
+        """Equal-width bin counts with np.histogram's binning, accumulated per thread chunk"""
+        bins = edges.shape[0] - 1
+        first_edge = edges[0]
+        width = edges[bins] - first_edge
+        chunk = (arr.shape[0] + n_chunks - 1) // n_chunks
+        partial = np.zeros((n_chunks, bins), dtype=np.int64)
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, arr.shape[0])):
+                value = arr[i]
+                idx = int((value - first_edge) / width * bins)
+                if idx == bins:
+                    idx -= 1
+                # Same edge corrections as np.histogram for values rounded into a neighbour
+                if value < edges[idx]:
+                    idx -= 1
+                elif idx != bins - 1 and value >= edges[idx + 1]:
+                    idx += 1
+                partial[c, idx] += 1
+        return partial.sum(axis=0)
+    
+    @njit(parallel=True, cache=True)
+    def _date_counts(ns, now_ns):
+        """One pass over epoch nanoseconds: dates after now and dates on a weekend"""
+        future = 0
+        weekend = 0
+        for i in prange(ns.shape[0]):
+            value = ns[i]
+            if value > now_ns:
+                future += 1
+            # 1970-01-01 was a Thursday (dayofweek 3); floor division handles pre-epoch dates
+            if (value // 86_400_000_000_000 + 3) % 7 >= 5:
+                weekend += 1
+        return future, weekend
+
+
+def _histogram(arr: np.ndarray, bins: int, value_range: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """np.histogram with equal-width bins over a finite (min, max), counted in parallel on large columns"""
+    if not (NUMBA_AVAILABLE and len(arr) > NUMBA_MIN_ROWS):
+        return np.histogram(arr, bins=bins, range=value_range)
+    
+    arr = arr.astype(np.float64, copy=False)
+    first_edge, last_edge = float(value_range[0]), float(value_range[1])
+    if first_edge == last_edge:
+        first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+    edges = np.linspace(first_edge, last_edge, bins + 1)
+    with _NUMBA_LOCK:
+        counts = _histogram_counts(arr, edges, get_num_threads())
+    return counts, edges
+
+
 class CSVProfiler:
     """CSV file profiler with comprehensive rule support"""
     
@@ -32,6 +343,20 @@ class CSVProfiler:
         self.sample_size = sample_size
         self.selected_columns = selected_columns
         
+        # Distinct values checked for PII before a column without a PII-like
+        # name is scanned in full
+        self.pii_prescreen_values: int = 200
+        
+        # Worker threads for per-column profiling
+        self.max_workers: int = os.cpu_count() or 1
+        
+        # Rows per chunk when a row sample is drawn from a file
+        self.chunk_rows: int = 200_000
+        
+        # Store integer columns in the smallest dtype holding their range (set
+        # False to profile the reader's int64 columns as-is)
+        self.downcast: bool = True
+        
         # PII detection patterns
         self.pii_patterns = {
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
@@ -40,139 +365,267 @@ class CSVProfiler:
             'credit_card': r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
             'ip_address': r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
         }
+        
+        # Compile regexes once instead of on every column; the alternation answers
+        # whether a value holds any PII, the per-type regexes which types
+        self._pii_combined = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.pii_patterns.values()),
+            re.IGNORECASE
+        )
+        self._pii_regexes = {
+            pii_type: re.compile(pattern, re.IGNORECASE)
+            for pii_type, pattern in self.pii_patterns.items()
+        }
+        # Optional Hyperscan database matching every PII pattern in one automaton
+        # pass, reporting each pattern at most once per scanned value
+        self._pii_db = None
+        if HYPERSCAN_AVAILABLE:
+            self._pii_db = hyperscan.Database()
+            self._pii_db.compile(
+                expressions=[pattern.encode() for pattern in self.pii_patterns.values()],
+                ids=list(range(len(self.pii_patterns))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.pii_patterns)
+            )
+        self._pii_name_hint_re = re.compile(
+            '|'.join(['email', 'mail', 'phone', 'mobile', 'contact', 'ssn', 'social', 'credit', 'card', 'ip', 'address']),
+            re.IGNORECASE
+        )
+        # Value signature: letters become 'A' and digits '9' in one str.translate
+        self._signature_table = str.maketrans(
+            {**dict.fromkeys(string.ascii_letters, 'A'), **dict.fromkeys(string.digits, '9')}
+        )
+        self._special_char_re = re.compile(r'[^a-zA-Z0-9\s]')
+        self._date_like_re = re.compile(r'^\d{2,4}[-/]\d{1,2}[-/]\d{1,4}')
+        # A time followed by a UTC designator or offset (kept as a string pattern
+        # since Arrow string columns do not take compiled regexes)
+        self._utc_offset_pattern = r'\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?\s*(?:[Zz]|[+-]\d{2}:?\d{2})$'
+        
+        # Shape of each reportable date format, checked without parsing
+        self._fmt_regexes = [
+            ('%Y-%m-%d', re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$')),
+            ('%m/%d/%Y', re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')),
+            ('%d-%m-%Y', re.compile(r'^\d{1,2}-\d{1,2}-\d{4}$')),
+            ('%Y/%m/%d', re.compile(r'^\d{4}/\d{1,2}/\d{1,2}$')),
+        ]
     
     def detect_encoding(self, file_path: Path) -> str:
         """Detect file encoding"""
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(10000)  # Read first 10KB
-            result = chardet.detect(raw_data)
-            return result['encoding'] if result['encoding'] else 'utf-8'
+        return detect_file_encoding(file_path)
     
-    def infer_data_type(self, series: pd.Series) -> str:
-        """Infer semantic data type from pandas series"""
-        dtype = series.dtype
+    def parse_datetimes(self, values: pd.Series, **kwargs) -> pd.Series:
+        """pd.to_datetime with unparsable values coerced to NaT; text carrying UTC offsets
+        is parsed to UTC, as mixed offsets are deprecated in pandas 2 and an error in 3"""
+        utc = False
+        if values.dtype.kind in 'OSU':
+            text = values if isinstance(values.dtype, pd.StringDtype) else values.astype(str)
+            utc = bool(text.str.contains(self._utc_offset_pattern, regex=True, na=False).any())
+        return pd.to_datetime(values, errors='coerce', utc=utc, **kwargs)
+    
+    def infer_data_type(self, series: pd.Series, non_null: Optional[pd.Series] = None) -> str:
+        """Infer semantic data type from pandas series (non_null: its values without nulls, if known)"""
+        kind = series.dtype.kind
         
         # Numeric types
-        if pd.api.types.is_integer_dtype(dtype):
+        if kind in 'iu':
             return "integer"
-        elif pd.api.types.is_float_dtype(dtype):
+        elif kind == 'f':
             return "float"
-        elif pd.api.types.is_bool_dtype(dtype):
+        elif kind == 'b':
             return "boolean"
         
         # Date/time types
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
+        elif kind == 'M':
             return "datetime"
         
         # String/object types - try to infer more specific types
-        elif pd.api.types.is_string_dtype(dtype) or pd.api.types.is_object_dtype(dtype):
+        elif kind in 'OSU':
             # Sample non-null values for inference
-            sample = series.dropna().head(100)
+            if non_null is None:
+                non_null = series.dropna()
+            sample = non_null.head(20).astype(str)
             if len(sample) == 0:
                 return "string"
             
-            # Check if it's a date string
-            try:
-                pd.to_datetime(sample)
+            # Cheap structural filter first; only date-shaped samples are parsed
+            if sample.str.match(self._date_like_re).mean() <= 0.8:
+                return "string"
+            
+            # Check if it's a date string (coerce unparsable values instead of raising)
+            parsed = self.parse_datetimes(sample, format='mixed')
+            if parsed.notna().sum() >= 0.9 * len(sample):
                 return "date_string"
-            except:
-                pass
             
             return "string"
         
-        return str(dtype)
+        return str(series.dtype)
     
-    def analyze_numeric_column(self, series: pd.Series) -> Optional[NumericStats]:
+    def analyze_numeric_column(self, ctx: ColumnContext) -> Optional[NumericStats]:
         """Analyze numeric column - Rule: Numeric Analysis"""
         if not self.rulesets.attribute_level.numeric_analysis:
             return None
             
-        if not pd.api.types.is_numeric_dtype(series):
+        if not ctx.is_numeric:
             return None
         
-        non_null = series.dropna()
+        non_null = ctx.non_null
         if len(non_null) == 0:
             return None
         
-        # Calculate quartiles and percentiles
-        q1 = float(non_null.quantile(0.25))
-        q3 = float(non_null.quantile(0.75))
+        # Calculate quartiles and percentiles with one O(n) selection over a
+        # float64 array that also serves every moment below (booleans as 0/1)
+        quantile_levels = [0.05, 0.25, 0.5, 0.75, 0.95]
+        arr = ctx.non_null_float
+        quantiles = _fast_quantiles(arr, quantile_levels)
+        percentile_5, q1, median, q3, percentile_95 = (float(v) for v in quantiles)
         iqr = q3 - q1
         
         # Outlier detection using IQR with Z-score fallback for zero IQR
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
-        outliers = non_null[(non_null < lower_bound) | (non_null > upper_bound)]
+        if NUMBA_AVAILABLE and len(arr) > NUMBA_MIN_ROWS:
+            # Fused single pass; sums are shifted by the median to limit cancellation
+            count = len(arr)
+            with _NUMBA_LOCK:
+                total, total_sq, min_val, max_val, outlier_count = _numeric_moments(arr, median, lower_bound, upper_bound)
+            variance = max((total_sq - total * total / count) / (count - 1), 0.0)
+            moments = {
+                'min': float(min_val),
+                'max': float(max_val),
+                'mean': float(median + total / count),
+                'std': float(np.sqrt(variance)),
+                'var': float(variance),
+            }
+        else:
+            # numpy reductions on the shared array; std reuses the variance
+            variance = float(arr.var(ddof=1)) if len(arr) > 1 else float('nan')
+            moments = {
+                'min': float(arr.min()),
+                'max': float(arr.max()),
+                'mean': float(arr.mean()),
+                'std': float(np.sqrt(variance)),
+                'var': variance,
+            }
+            # Zero IQR is settled by the fallback below; skip the mask pass
+            outlier_count = 0 if iqr == 0 else int(((arr < lower_bound) | (arr > upper_bound)).sum())
         if iqr == 0:
-            mean_val = float(non_null.mean())
-            std_val = float(non_null.std(ddof=0))
-            if std_val > 0:
-                z_scores = (non_null - mean_val) / std_val
-                outliers = non_null[z_scores.abs() > 3]
+            # A constant column has no outliers; otherwise fall back to Z-scores
+            outlier_count = 0
+            if moments['min'] != moments['max']:
+                z_scores = (arr - moments['mean']) / arr.std()
+                outlier_count = int((np.abs(z_scores) > 3).sum())
 
         return NumericStats(
-            min=float(non_null.min()),
-            max=float(non_null.max()),
-            mean=float(non_null.mean()),
-            median=float(non_null.median()),
-            std_dev=float(non_null.std()),
-            variance=float(non_null.var()),
+            min=moments['min'],
+            max=moments['max'],
+            mean=moments['mean'],
+            median=median,
+            std_dev=moments['std'],
+            variance=moments['var'],
             q1=q1,
             q3=q3,
-            percentile_5=float(non_null.quantile(0.05)),
+            percentile_5=percentile_5,
             percentile_25=q1,
             percentile_75=q3,
-            percentile_95=float(non_null.quantile(0.95)),
-            outlier_count=len(outliers),
-            outlier_percentage=float(len(outliers) / len(non_null) * 100)
+            percentile_95=percentile_95,
+            outlier_count=outlier_count,
+            outlier_percentage=float(outlier_count / len(non_null) * 100)
         )
     
-    def analyze_string_column(self, series: pd.Series) -> Optional[StringStats]:
+    def _signature(self, s: pd.Series) -> pd.Series:
+        """Mask letters as 'A' and digits as '9' to expose value patterns"""
+        return s.str.translate(self._signature_table)
+    
+    def _string_flags(self, values: pd.Series) -> Dict[str, np.ndarray]:
+        """Per-value length and character-class flags used by analyze_string_column"""
+        if PYARROW_AVAILABLE:
+            flags = _byte_class_flags(values)
+            non_ascii = flags.pop('non_ascii')
+            if not non_ascii.any():
+                return flags
+            # Only rows with multi-byte characters need the Unicode-aware predicates
+            for key, column_flags in self._string_flags_by_predicate(values[non_ascii]).items():
+                flags[key][non_ascii] = column_flags
+            return flags
+        return self._string_flags_by_predicate(values)
+    
+    def _string_flags_by_predicate(self, values: pd.Series) -> Dict[str, np.ndarray]:
+        """Per-value length and character-class flags from pandas string predicates"""
+        # Python str semantics (Unicode whitespace, compiled patterns) need object values
+        if values.dtype != object:
+            values = values.astype(object)
+        
+        def to_bool(flags: pd.Series) -> np.ndarray:
+            # Nullable boolean first: fillna on the object result would downcast (deprecated)
+            return flags.astype('boolean').fillna(False).to_numpy(dtype=bool)
+        
+        return {
+            'length': values.str.len().to_numpy(dtype=np.int64),
+            'empty': to_bool(values == ''),
+            'whitespace_only': to_bool(values.str.isspace()),
+            'leading_spaces': to_bool(values.str[0].str.isspace()),
+            'trailing_spaces': to_bool(values.str[-1].str.isspace()),
+            'alphanumeric': to_bool(values.str.isalnum()),
+            'alpha_only': to_bool(values.str.isalpha()),
+            'numeric_only': to_bool(values.str.isdigit()),
+            'special_chars': to_bool(values.str.contains(self._special_char_re)),
+        }
+    
+    def analyze_string_column(self, ctx: ColumnContext) -> Optional[StringStats]:
         """Analyze string column - Rule: String Analysis"""
         if not self.rulesets.attribute_level.string_analysis:
             return None
             
-        if not (pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(series)):
+        if not ctx.is_string:
             return None
         
-        non_null = series.dropna().astype(str)
-        if len(non_null) == 0:
+        if len(ctx.non_null) == 0:
             return None
         
+        # Low-cardinality columns are analyzed per distinct value, weighted by
+        # frequency, so the string kernels run over O(unique) instead of O(n)
+        # String-dtype columns stay Arrow-backed instead of being boxed to Python str
+        keep_dtype = isinstance(ctx.non_null.dtype, pd.StringDtype)
+        if len(ctx.value_counts) < 0.05 * len(ctx.series):
+            distinct = ctx.value_counts.index
+            values = pd.Series(distinct if keep_dtype else distinct.astype(str))
+            weights = ctx.value_counts.to_numpy()
+        else:
+            values = ctx.non_null if keep_dtype else ctx.non_null_str
+            weights = None
+        
+        def weighted_count(flags: np.ndarray) -> int:
+            return int(flags.sum() if weights is None else weights[flags].sum())
+        
+        # Lengths and character classes in a single pass over the values
+        flags = self._string_flags(values)
+        
         # Length statistics
-        lengths = non_null.str.len()
+        lengths = flags['length']
+        avg_length = lengths.mean() if weights is None else np.average(lengths, weights=weights)
         
         # Space detection
-        empty_strings = (non_null == '').sum()
-        whitespace_only = non_null.str.match(r'^\s+$').sum()
-        leading_spaces = (non_null != non_null.str.lstrip()).sum()
-        trailing_spaces = (non_null != non_null.str.rstrip()).sum()
+        empty_strings = weighted_count(flags['empty'])
+        whitespace_only = weighted_count(flags['whitespace_only'])
+        leading_spaces = weighted_count(flags['leading_spaces'])
+        trailing_spaces = weighted_count(flags['trailing_spaces'])
         
         # Pattern analysis - detect common patterns
-        patterns = []
-        for val in non_null.head(100):
-            pattern = re.sub(r'[a-zA-Z]', 'A', val)
-            pattern = re.sub(r'[0-9]', '9', pattern)
-            patterns.append(pattern)
-        
-        pattern_counter = Counter(patterns)
+        pattern_counts = _top_counts(self._signature(ctx.non_null.head(100).astype(str)).value_counts(sort=False), 5)
         common_patterns = [
-            {"pattern": pattern, "count": count}
-            for pattern, count in pattern_counter.most_common(5)
+            {"pattern": pattern, "count": int(count)}
+            for pattern, count in pattern_counts.items()
         ]
         
         # Character set analysis
         char_sets = {
-            'alphanumeric': non_null.str.match(r'^[a-zA-Z0-9]+$').sum(),
-            'alpha_only': non_null.str.match(r'^[a-zA-Z]+$').sum(),
-            'numeric_only': non_null.str.match(r'^[0-9]+$').sum(),
-            'special_chars': non_null.str.contains(r'[^a-zA-Z0-9\s]').sum()
+            key: weighted_count(flags[key])
+            for key in ('alphanumeric', 'alpha_only', 'numeric_only', 'special_chars')
         }
         
         return StringStats(
             min_length=int(lengths.min()),
             max_length=int(lengths.max()),
-            avg_length=float(lengths.mean()),
+            avg_length=float(avg_length),
             empty_string_count=int(empty_strings),
             whitespace_only_count=int(whitespace_only),
             leading_spaces_count=int(leading_spaces),
@@ -181,69 +634,89 @@ class CSVProfiler:
             character_set_summary=char_sets
         )
     
-    def analyze_datetime_column(self, series: pd.Series) -> Optional[DateTimeStats]:
+    def analyze_datetime_column(self, ctx: ColumnContext) -> Optional[DateTimeStats]:
         """Analyze date/time column - Rule: Date/Time Analysis"""
         if not self.rulesets.attribute_level.date_time_analysis:
             return None
         
-        # Try to convert to datetime
+        # Booleans cannot be converted to datetimes
+        if ctx.kind == 'b':
+            return None
+        
         try:
-            dt_series = pd.to_datetime(series, errors='coerce')
-            valid_dates = dt_series.dropna()
-            
-            if len(valid_dates) == 0:
-                return None
+            # Text columns where few sampled values parse are not dates; skip the
+            # full-column parse, which falls back to per-value dateutil parsing
+            if ctx.is_string:
+                sample_parsed = self.parse_datetimes(ctx.non_null.head(50))
+                if sample_parsed.notna().mean() < 0.3:
+                    return None
             
-            non_null_total = series.notnull().sum()
-            format_consistency = (len(valid_dates) / non_null_total) if non_null_total > 0 else 0
-            
-            min_date = valid_dates.min()
-            max_date = valid_dates.max()
+            # Try to convert to datetime
+            dt_series = self.parse_datetimes(ctx.non_null)
+        except (TypeError, ValueError):
+            # Values pandas cannot interpret as datetimes at all, e.g. mixed objects
+            return None
+        valid_dates = dt_series.dropna()
+        
+        if len(valid_dates) == 0:
+            return None
+        
+        non_null_total = len(ctx.non_null)
+        format_consistency = (len(valid_dates) / non_null_total) if non_null_total > 0 else 0
+        
+        min_date = valid_dates.min()
+        max_date = valid_dates.max()
+        try:
             date_range = (max_date - min_date).days
-            
-            # Detect formats
-            non_null = series.dropna().astype(str)
-            detected_formats = []
-            for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y', '%Y/%m/%d']:
-                try:
-                    pd.to_datetime(non_null.head(10), format=fmt)
-                    detected_formats.append(fmt)
-                except:
-                    pass
-            
-            # Invalid dates
-            invalid_count = len(series.dropna()) - len(valid_dates)
-            
-            # Future dates
-            now = pd.Timestamp.now()
+        except (OverflowError, pd.errors.OutOfBoundsDatetime):
+            # Spans beyond Timedelta's ~292 years; microsecond precision is plenty for days
+            date_range = (max_date.to_pydatetime() - min_date.to_pydatetime()).days
+        
+        # Detect formats by shape on a small sample, no date parsing
+        format_sample = ctx.non_null.head(10).astype(str)
+        detected_formats = [
+            fmt for fmt, fmt_re in self._fmt_regexes
+            if format_sample.str.match(fmt_re).all()
+        ]
+        
+        # Invalid dates
+        invalid_count = non_null_total - len(valid_dates)
+        
+        # Future dates and weekend/weekday analysis; tz-aware dates compare against
+        # the current time in their own zone
+        now = pd.Timestamp.now(tz=valid_dates.dt.tz)
+        if NUMBA_AVAILABLE and len(valid_dates) > NUMBA_MIN_ROWS and valid_dates.dtype == 'datetime64[ns]':
+            # Fused pass over the raw int64 values of naive nanosecond timestamps
+            with _NUMBA_LOCK:
+                future_count, weekend_count = _date_counts(valid_dates.to_numpy().view(np.int64), now.value)
+        else:
             future_count = (valid_dates > now).sum()
-            
-            # Weekend/weekday analysis
-            weekend_count = valid_dates.dt.dayofweek.isin([5, 6]).sum()
-            weekday_count = len(valid_dates) - weekend_count
-            
-            return DateTimeStats(
-                min_date=str(min_date),
-                max_date=str(max_date),
-                date_range_days=int(date_range),
-                detected_formats=detected_formats,
-                invalid_date_count=int(invalid_count),
-                future_date_count=int(future_count),
-                weekend_count=int(weekend_count),
-                weekday_count=int(weekday_count),
-                format_consistency=float(format_consistency)
-            )
-        except:
-            return None
+            weekend_count = (valid_dates.dt.dayofweek >= 5).sum()
+        weekday_count = len(valid_dates) - weekend_count
+        
+        return DateTimeStats(
+            min_date=str(min_date),
+            max_date=str(max_date),
+            date_range_days=int(date_range),
+            detected_formats=detected_formats,
+            invalid_date_count=int(invalid_count),
+            future_date_count=int(future_count),
+            weekend_count=int(weekend_count),
+            weekday_count=int(weekday_count),
+            format_consistency=float(format_consistency)
+        )
     
-    def calculate_column_quality(self, series: pd.Series, data_type: str) -> Optional[ColumnQualityMetrics]:
+    def calculate_column_quality(self, ctx: ColumnContext, data_type: str) -> Optional[ColumnQualityMetrics]:
         """Calculate column quality metrics - Rule: Column Quality"""
         if not self.rulesets.attribute_level.column_quality:
             return None
         
-        total_count = len(series)
-        null_rate = float(series.isnull().mean()) if total_count > 0 else 0.0
-        distinctness_ratio = float(series.nunique(dropna=False) / total_count) if total_count > 0 else 0.0
+        total_count = len(ctx.series)
+        null_count = ctx.null_count
+        # Distinct values including null as its own value
+        distinct_count = len(ctx.value_counts) + (1 if null_count > 0 else 0)
+        null_rate = float(null_count / total_count) if total_count > 0 else 0.0
+        distinctness_ratio = float(distinct_count / total_count) if total_count > 0 else 0.0
 
         # Grade assignment based on Generic_Rules.md thresholds
         if null_rate <= 0.01 and 0.05 <= distinctness_ratio <= 0.95:
@@ -272,43 +745,47 @@ class CSVProfiler:
             quality_grade=grade
         )
     
-    def calculate_value_distribution(self, series: pd.Series) -> Optional[ValueDistribution]:
+    def calculate_value_distribution(self, ctx: ColumnContext) -> Optional[ValueDistribution]:
         """Calculate value distribution - Rule: Value Distribution"""
         if not self.rulesets.attribute_level.value_distribution:
             return None
         
-        non_null = series.dropna()
+        non_null = ctx.non_null
         
         if len(non_null) == 0:
             return None
         
         total_count = len(non_null)
         
-        cardinality = non_null.nunique()
-        cardinality_ratio = cardinality / len(series) if len(series) > 0 else 0
+        cardinality = len(ctx.value_counts)
+        cardinality_ratio = cardinality / len(ctx.series) if len(ctx.series) > 0 else 0
+        
+        # Top and bottom values (default N=10) via partial selection, not a full sort
+        top_counts = _top_counts(ctx.value_counts, 10)
+        bottom_counts = _top_counts(ctx.value_counts, 10, ascending=True)
         
         # Mode
-        value_counts = non_null.value_counts()
-        mode = value_counts.index[0] if len(value_counts) > 0 else None
-        mode_frequency = int(value_counts.iloc[0]) if len(value_counts) > 0 else None
+        mode = top_counts.index[0] if len(top_counts) > 0 else None
+        mode_frequency = int(top_counts.iloc[0]) if len(top_counts) > 0 else None
         
-        # Top and bottom values (default N=10)
         top_values = [
             {"value": str(val), "count": int(count), "percentage": float(count / total_count * 100)}
-            for val, count in value_counts.head(10).items()
+            for val, count in top_counts.items()
         ]
         
-        bottom_counts = non_null.value_counts(ascending=True)
         bottom_values = [
             {"value": str(val), "count": int(count), "percentage": float(count / total_count * 100)}
-            for val, count in bottom_counts.head(10).items()
+            for val, count in bottom_counts.items()
         ]
         
         # Histogram bins for numeric data (default 20 bins)
         histogram_bins = []
-        if pd.api.types.is_numeric_dtype(series):
-            try:
-                counts, bin_edges = np.histogram(non_null, bins=20)
+        if ctx.is_numeric and ctx.kind != 'b':
+            values = ctx.non_null_float
+            value_range = (values.min(), values.max())
+            # Infinite values leave no finite range to bin
+            if np.isfinite(value_range).all():
+                counts, bin_edges = _histogram(values, 20, value_range)
                 histogram_bins = [
                     {
                         "bin_start": float(bin_edges[i]),
@@ -317,16 +794,11 @@ class CSVProfiler:
                     }
                     for i in range(len(counts))
                 ]
-            except:
-                pass
         
         # Skewness
         skewness = None
-        if pd.api.types.is_numeric_dtype(series):
-            try:
-                skewness = float(non_null.skew())
-            except:
-                pass
+        if ctx.is_numeric:
+            skewness = float(non_null.skew())
         
         return ValueDistribution(
             cardinality=cardinality,
@@ -339,29 +811,64 @@ class CSVProfiler:
             skewness=skewness
         )
     
-    def detect_pii(self, series: pd.Series) -> Optional[PIIDetection]:
+    def detect_pii(self, ctx: ColumnContext) -> Optional[PIIDetection]:
         """Detect PII in column - Rule: PII Detection"""
         if not self.rulesets.attribute_level.pii_detection:
             return None
         
-        non_null = series.dropna().astype(str)
-        if len(non_null) == 0:
+        non_null_count = len(ctx.non_null)
+        if non_null_count == 0:
             return None
 
-        combined_pattern = "|".join(self.pii_patterns.values())
-        match_series = non_null.str.contains(combined_pattern, regex=True, case=False, na=False)
-        match_rate = float(match_series.mean())
-
-        # Pattern-specific flags
-        pii_flags = {
-            pii_type: bool(non_null.str.contains(pattern, regex=True, case=False, na=False).any())
-            for pii_type, pattern in self.pii_patterns.items()
-        }
+        # Scan each distinct value once (weighted by its frequency) instead of
+        # materializing a string copy of every row. Hyperscan takes ASCII values,
+        # where its byte-wise \b and \d agree with Python's; the rest go through
+        # the combined regex and, on a match, the per-type regexes
+        pii_types = list(self.pii_patterns)
+        pii_flags = dict.fromkeys(pii_types, False)
+        matched_rows = 0
+        # Scratch space is per call since columns are scanned on several threads
+        scratch = hyperscan.Scratch(self._pii_db) if self._pii_db is not None else None
+        found = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.append(pii_types[pattern_id])
+        
+        # Column name hints
+        name_hint = 0.3 if self._pii_name_hint_re.search(str(ctx.series.name)) else 0.0
+        
+        # Prescreen: without a name hint, a column whose first distinct values
+        # hold no PII is not scanned any further
+        distinct_values = ctx.value_counts.index
+        counts = ctx.value_counts.to_numpy()
+        batches = [slice(None)]
+        if name_hint == 0 and len(distinct_values) > self.pii_prescreen_values:
+            batches = [slice(None, self.pii_prescreen_values), slice(self.pii_prescreen_values, None)]
+        
+        for batch in batches:
+            if batch.start is not None and matched_rows == 0:
+                break
+            for value, count in zip(distinct_values[batch].astype(str), counts[batch]):
+                found.clear()
+                if scratch is not None and value.isascii():
+                    self._pii_db.scan(value.encode(), match_event_handler=on_match, scratch=scratch)
+                    matched = bool(found)
+                else:
+                    # The alternation reports one type per position and consumes its
+                    # text, so overlapping types come from independent searches
+                    matched = self._pii_combined.search(value) is not None
+                    if matched:
+                        found.extend(
+                            pii_type for pii_type in pii_types
+                            if not pii_flags[pii_type] and self._pii_regexes[pii_type].search(value)
+                        )
+                if matched:
+                    matched_rows += int(count)
+                    for pii_type in found:
+                        pii_flags[pii_type] = True
+        match_rate = float(matched_rows / non_null_count)
         pii_categories = [pii_type for pii_type, flag in pii_flags.items() if flag]
 
-        # Column name hints
-        name_keywords = ['email', 'mail', 'phone', 'mobile', 'contact', 'ssn', 'social', 'credit', 'card', 'ip', 'address']
-        name_hint = 0.3 if any(keyword in series.name.lower() for keyword in name_keywords) else 0.0
         if name_hint > 0:
             pii_categories.append('name_hint')
 
@@ -387,21 +894,57 @@ class CSVProfiler:
             risk_level=risk_level
         )
     
-    def calculate_column_stats(self, df: pd.DataFrame, column_name: str) -> ColumnStats:
+    def calculate_numeric_summaries(self, df: pd.DataFrame, columns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Calculate legacy min/max/mean/median/std for all numeric columns in one pass"""
+        numeric_columns = [
+            col for col in columns
+            if df[col].dtype.kind in 'iufc'
+        ]
+        if not numeric_columns:
+            return {}
+        
+        return df[numeric_columns].agg(['min', 'max', 'mean', 'median', 'std']).to_dict()
+    
+    def calculate_column_stats(
+        self,
+        df: pd.DataFrame,
+        column_name: str,
+        numeric_summary: Optional[Dict[str, Any]] = None,
+        null_count: Optional[int] = None
+    ) -> ColumnStats:
         """Calculate comprehensive statistics for a single column"""
         series = df[column_name]
+        
+        # Non-null values and value counts are shared by all analyzers; a known
+        # null-free column skips the mask and copy entirely
+        non_null = series if null_count == 0 else series.dropna()
+        ctx = ColumnContext(
+            series=series,
+            non_null=non_null,
+            value_counts=non_null.value_counts(sort=False),
+            kind=series.dtype.kind,
+        )
+        
         total_count = len(series)
-        null_count = series.isnull().sum()
-        non_null_count = total_count - null_count
+        null_count = ctx.null_count
+        non_null_count = len(non_null)
         
         # Basic stats - Rule: Column Statistics
         null_percentage = (null_count / total_count * 100) if total_count > 0 else 0
-        unique_count = series.nunique()
+        unique_count = len(ctx.value_counts)
         unique_percentage = (unique_count / total_count * 100) if total_count > 0 else 0
         duplicate_count = total_count - unique_count
         
         # Data type - Rule: Data Type Analysis
-        data_type = self.infer_data_type(series)
+        data_type = self.infer_data_type(series, ctx.non_null)
+        
+        # Apply attribute-level rules
+        numeric_stats = self.analyze_numeric_column(ctx)
+        string_stats = self.analyze_string_column(ctx)
+        datetime_stats = self.analyze_datetime_column(ctx)
+        quality_metrics = self.calculate_column_quality(ctx, data_type)
+        value_distribution = self.calculate_value_distribution(ctx)
+        pii_detection = self.detect_pii(ctx)
         
         # Legacy fields for backward compatibility
         min_value = None
@@ -411,29 +954,31 @@ class CSVProfiler:
         std_dev = None
         top_values = []
         
-        if pd.api.types.is_numeric_dtype(series) and non_null_count > 0:
-            min_value = float(series.min())
-            max_value = float(series.max())
-            mean = float(series.mean())
-            median = float(series.median())
-            std_dev = float(series.std())
+        if numeric_stats is not None:
+            # Reuse the exact full-column numeric analysis
+            min_value = numeric_stats.min
+            max_value = numeric_stats.max
+            mean = numeric_stats.mean
+            median = numeric_stats.median
+            std_dev = numeric_stats.std_dev
+        elif ctx.is_numeric and non_null_count > 0:
+            if numeric_summary is None:
+                numeric_summary = non_null.agg(['min', 'max', 'mean', 'median', 'std']).to_dict()
+            min_value = float(numeric_summary['min'])
+            max_value = float(numeric_summary['max'])
+            mean = float(numeric_summary['mean'])
+            median = float(numeric_summary['median'])
+            std_dev = float(numeric_summary['std'])
         
         if non_null_count > 0:
-            value_counts = series.value_counts().head(5)
+            # Exact counts from the full-column value counts every analyzer shares
             top_values = [
                 {"value": str(value), "count": int(count), "percentage": float(count / total_count * 100)}
-                for value, count in value_counts.items()
+                for value, count in _top_counts(ctx.value_counts, 5).items()
             ]
         
-        # Apply attribute-level rules
-        numeric_stats = self.analyze_numeric_column(series)
-        string_stats = self.analyze_string_column(series)
-        datetime_stats = self.analyze_datetime_column(series)
-        quality_metrics = self.calculate_column_quality(series, data_type)
-        value_distribution = self.calculate_value_distribution(series)
-        pii_detection = self.detect_pii(series)
-        
-        return ColumnStats(
+        # Values are computed and cast above, so skip Pydantic validation
+        return ColumnStats.model_construct(
             column_name=column_name,
             data_type=data_type,
             null_count=int(null_count),
@@ -455,7 +1000,48 @@ class CSVProfiler:
             pii_detection=pii_detection
         )
     
-    def calculate_dataset_statistics(self, df: pd.DataFrame, file_size: int, profiling_duration: float) -> Optional[DatasetStatistics]:
+    def rows_fitting_memory(self, file_path: Path, memory_bytes: int) -> int:
+        """Rows whose profile fits in memory_bytes, from the average row length of the file's head"""
+        with open(file_path, 'rb') as f:
+            head = f.read(ENCODING_SAMPLE_BYTES)
+        row_bytes = len(head) / max(head.count(b'\n'), 1)
+        return max(int(memory_bytes / (PROFILE_MEMORY_FACTOR * row_bytes)), 1)
+    
+    def read_csv_sample(self, read_kwargs: Dict[str, Any], sample_size: int) -> pd.DataFrame:
+        """Uniform random sample of rows, in file order, by bottom-k reservoir sampling over row chunks"""
+        # Every row gets a random key and the sample_size smallest keys are kept, so
+        # memory stays at one chunk plus the reservoir however large the file is
+        # Chunks are kept as raw text: types inferred chunk by chunk would differ
+        # from a full read (an int chunk and a text chunk of the same column)
+        rng = np.random.default_rng(0)
+        reservoir = None
+        reservoir_keys = np.empty(0)
+        for chunk in pd.read_csv(**read_kwargs, chunksize=self.chunk_rows, dtype=str, na_filter=False):
+            rows = chunk if reservoir is None else pd.concat([reservoir, chunk])
+            keys = np.concatenate([reservoir_keys, rng.random(len(chunk))])
+            if len(rows) > sample_size:
+                # Sorted positions keep the original row order (chunks continue the index)
+                keep = np.sort(np.argpartition(keys, sample_size - 1)[:sample_size])
+                rows = rows.iloc[keep]
+                keys = keys[keep]
+            reservoir, reservoir_keys = rows, keys
+        if reservoir is None:
+            return pd.read_csv(**read_kwargs)
+        # Parse the sampled rows' text once more so nulls and types come out as in a full read
+        return pd.read_csv(io.StringIO(reservoir.to_csv(index=False)))
+    
+    def downcast_integer_columns(self, df: pd.DataFrame) -> None:
+        """Downcast int64 columns in place to the smallest integer dtype holding their range"""
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    def calculate_dataset_statistics(
+        self,
+        df: pd.DataFrame,
+        file_size: int,
+        profiling_duration: float,
+        profiled_at: Optional[datetime] = None
+    ) -> Optional[DatasetStatistics]:
         """Calculate dataset statistics - Rule: Dataset Statistics"""
         if not self.rulesets.dataset_level.dataset_statistics:
             return None
@@ -465,16 +1051,21 @@ class CSVProfiler:
             total_columns=len(df.columns),
             dataset_size_bytes=file_size,
             profiling_duration_seconds=profiling_duration,
-            profiled_at=datetime.now()
+            profiled_at=profiled_at or datetime.now()
         )
     
-    def calculate_dataset_quality(self, df: pd.DataFrame, column_stats: List[ColumnStats]) -> Optional[DatasetQualityMetrics]:
+    def calculate_dataset_quality(
+        self,
+        df: pd.DataFrame,
+        column_stats: List[ColumnStats],
+        null_counts: Dict[str, int]
+    ) -> Optional[DatasetQualityMetrics]:
         """Calculate dataset quality metrics - Rule: Dataset Quality"""
         if not self.rulesets.dataset_level.dataset_quality:
             return None
         
         total_cells = len(df) * len(df.columns)
-        total_nulls = df.isnull().sum().sum()
+        total_nulls = sum(null_counts.values())
         overall_completeness = ((total_cells - total_nulls) / total_cells * 100) if total_cells > 0 else 0
         
         # Calculate average quality score from columns
@@ -515,7 +1106,12 @@ class CSVProfiler:
             pii_risk_level=pii_risk_level
         )
     
-    def analyze_referential_integrity(self, df: pd.DataFrame) -> Optional[ReferentialIntegrity]:
+    def analyze_referential_integrity(
+        self,
+        df: pd.DataFrame,
+        null_counts: Dict[str, int],
+        distinct_counts: Optional[Dict[str, int]] = None
+    ) -> Optional[ReferentialIntegrity]:
         """Analyze referential integrity - Rule: Referential Integrity"""
         if not self.rulesets.dataset_level.referential_integrity:
             return None
@@ -532,7 +1128,7 @@ class CSVProfiler:
         
         for id_col in id_columns:
             # Check for nulls in ID columns (potential orphans)
-            null_ids = df[id_col].isnull().sum()
+            null_ids = null_counts[id_col]
             if null_ids > 0:
                 orphan_records.append({
                     "column": id_col,
@@ -540,21 +1136,28 @@ class CSVProfiler:
                     "message": f"{id_col} has {null_ids} null values"
                 })
         
-        # Foreign key style checks: child `_id` column should exist in parent column with same base name
+        # Foreign key style checks: child `_id` column should exist in parent column with same base name.
+        # Parent value sets are built once per parent column (a shared `id` column serves
+        # every child), and each child is checked per distinct value, weighted by count
+        parent_values = {}
         for child_col in id_columns:
             base_name = child_col[:-3].lower()  # remove '_id'
             parent_candidates = [c for c in df.columns if c.lower() == base_name or c.lower() == f"{base_name}id" or c.lower() == "id"]
+            if not parent_candidates:
+                continue
+            
+            child_counts = df[child_col].value_counts(sort=False)
+            child_total = int(child_counts.sum())
+            if child_total == 0:
+                continue
             
             for parent_col in parent_candidates:
-                child_non_null = df[child_col].dropna()
-                parent_non_null = df[parent_col].dropna()
-                
-                if len(child_non_null) == 0:
-                    continue
+                if parent_col not in parent_values:
+                    parent_values[parent_col] = df[parent_col].dropna().unique()
                 
-                missing_mask = ~child_non_null.isin(parent_non_null)
-                missing_count = int(missing_mask.sum())
-                match_rate = 1 - (missing_count / len(child_non_null))
+                missing_mask = ~child_counts.index.isin(parent_values[parent_col])
+                missing_count = int(child_counts.to_numpy()[missing_mask].sum())
+                match_rate = 1 - (missing_count / child_total)
                 
                 foreign_key_checks.append({
                     "child_column": child_col,
@@ -564,8 +1167,13 @@ class CSVProfiler:
                 })
         
         # Check for duplicate IDs in ID columns (consistency check)
+        distinct_counts = distinct_counts or {}
         for id_col in id_columns:
-            duplicates = df[id_col].duplicated().sum()
+            # Every row beyond the first of each distinct value (null counted as one value)
+            if id_col in distinct_counts:
+                duplicates = len(df) - distinct_counts[id_col]
+            else:
+                duplicates = df[id_col].duplicated().sum()
             if duplicates > 0:
                 cross_table_consistency.append({
                     "column": id_col,
@@ -579,7 +1187,12 @@ class CSVProfiler:
             cross_table_consistency=cross_table_consistency
         )
     
-    def discover_candidate_keys(self, df: pd.DataFrame) -> Optional[CandidateKeys]:
+    def discover_candidate_keys(
+        self,
+        df: pd.DataFrame,
+        null_counts: Dict[str, int],
+        distinct_counts: Optional[Dict[str, int]] = None
+    ) -> Optional[CandidateKeys]:
         """Discover candidate keys - Rule: Candidate Key Discovery"""
         if not self.rulesets.dataset_level.candidate_keys:
             return None
@@ -590,14 +1203,21 @@ class CSVProfiler:
         
         total_rows = len(df)
         
+        # Per-column cardinality and null presence, reused by the pair search;
+        # profiled columns already counted their distinct values
+        distinct_counts = distinct_counts or {}
+        nuniques = {
+            col: distinct_counts[col] if col in distinct_counts else df[col].nunique(dropna=False)
+            for col in df.columns
+        }
+        nulls_any = {col: null_counts[col] > 0 for col in df.columns}
+        
         # Single column key analysis (must be fully non-null and unique)
         for col in df.columns:
-            null_count = df[col].isnull().sum()
-            if null_count > 0 or total_rows == 0:
+            if nulls_any[col] or total_rows == 0:
                 continue
 
-            unique_count = df[col].nunique(dropna=False)
-            is_unique = unique_count == total_rows
+            is_unique = nuniques[col] == total_rows
 
             if not is_unique:
                 continue
@@ -615,17 +1235,35 @@ class CSVProfiler:
             primary_key_suggestions.append(candidate)
         
         # Composite key analysis (2-column combinations only for performance)
-        if len(df.columns) <= 20 and total_rows > 0:  # Only for smaller datasets
+        if len(df.columns) <= 50 and total_rows > 0:  # Only for smaller datasets
+            single_keys = {candidate.columns[0] for candidate in single_column_keys}
+            column_codes = {}
+            
+            def factorized(col: str) -> Tuple[np.ndarray, int]:
+                """Dense integer codes of one column and their count, computed once and reused by every pair"""
+                if col not in column_codes:
+                    codes, uniques = pd.factorize(df[col])
+                    column_codes[col] = (codes.astype(np.int64, copy=False), len(uniques))
+                return column_codes[col]
+            
             for col1, col2 in combinations(df.columns, 2):
-                pair = df[[col1, col2]]
-                if pair.isnull().any(axis=1).any():
+                if nulls_any[col1] or nulls_any[col2]:
                     continue
-
-                unique_count = pair.drop_duplicates().shape[0]
-                is_unique = unique_count == total_rows
                 
-                if not is_unique:
-                    continue
+                # A key column determines every other column, so the pair is unique
+                # without looking at the data
+                if col1 not in single_keys and col2 not in single_keys:
+                    # A pair cannot be unique if its cardinality product is below the row count
+                    if nuniques[col1] * nuniques[col2] < total_rows:
+                        continue
+                    
+                    # Exact pair code from the cached factorized codes; each cardinality is
+                    # at most the row count, so the code stays below rows**2 and could only
+                    # overflow int64 beyond about 3e9 rows
+                    codes1, _ = factorized(col1)
+                    codes2, n_codes2 = factorized(col2)
+                    if len(pd.unique(codes1 * n_codes2 + codes2)) != total_rows:
+                        continue
                 
                 candidate = CandidateKey(
                     columns=[col1, col2],
@@ -649,10 +1287,11 @@ class CSVProfiler:
     
     def profile_csv(self, file_path: Path, dataset_name: str) -> DatasetProfile:
         """Profile a single CSV file with comprehensive rules"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Detect encoding
         encoding = self.detect_encoding(file_path)
+        file_size = file_path.stat().st_size
         
         # Read CSV
         read_kwargs = {
@@ -662,30 +1301,64 @@ class CSVProfiler:
             'header': 0 if self.csv_config.has_header else None,
         }
         
-        if self.sample_size:
-            read_kwargs['nrows'] = self.sample_size
+        # Without a header, name the columns in the reader from a one-row probe
+        if not self.csv_config.has_header:
+            n_cols = pd.read_csv(
+                file_path, sep=self.csv_config.delimiter, encoding=encoding, header=None, nrows=1
+            ).shape[1]
+            read_kwargs['names'] = [f"Column_{i+1}" for i in range(n_cols)]
+        
+        sample_size = self.sample_size
+        physical_memory = physical_memory_bytes()
+        if not sample_size and physical_memory is not None and file_size * PROFILE_MEMORY_FACTOR >= physical_memory:
+            # A full profile would not fit in memory; fall back to the largest row
+            # sample that does, since the sampled read is bounded by chunk plus sample
+            sample_size = self.rows_fitting_memory(file_path, physical_memory)
+            print(f"{file_path.name} is too large to profile in memory; profiling a sample of {sample_size} rows")
+        
+        if sample_size:
+            # A uniform row sample; the first rows are biased on sorted files
+            df = self.read_csv_sample(read_kwargs, sample_size)
+        else:
+            # Every read path uses pandas' C parser so column types are inferred the
+            # same way (the Arrow engine also infers timestamps and rejects short rows).
+            # Memory-map the file so the parser reads straight from the page cache
+            df = pd.read_csv(**read_kwargs, memory_map=True)
         
-        df = pd.read_csv(**read_kwargs)
+        # Arrow-backed strings let min/max/nunique/value_counts run in C++ kernels
+        object_columns = df.select_dtypes(include='object').columns
+        if len(object_columns) > 0:
+            df[object_columns] = df[object_columns].astype(STRING_DTYPE)
         
-        # If no header, generate column names
-        if not self.csv_config.has_header:
-            df.columns = [f"Column_{i+1}" for i in range(len(df.columns))]
+        # Narrower integers cut the bytes every later scan reads; the values are unchanged
+        if self.downcast:
+            self.downcast_integer_columns(df)
         
         # Filter columns if specific columns are selected
         columns_to_profile = df.columns
         if self.selected_columns:
             columns_to_profile = [col for col in df.columns if col in self.selected_columns]
         
-        # Calculate statistics for each column (Attribute-Level Rules)
-        column_stats = []
-        for column in columns_to_profile:
+        # Null counts per column, computed once and shared by every rule
+        null_counts = {col: count_nulls(df[col]) for col in df.columns}
+        
+        # Legacy numeric summaries in one vectorized call, only needed when the
+        # numeric analysis (which the legacy fields reuse) is switched off
+        numeric_summaries = {}
+        if not self.rulesets.attribute_level.numeric_analysis:
+            numeric_summaries = self.calculate_numeric_summaries(df, list(columns_to_profile))
+        
+        # Calculate statistics for each column (Attribute-Level Rules); columns are
+        # independent and pandas/numpy/Arrow kernels release the GIL, so use threads
+        def profile_column(column: str) -> ColumnStats:
             try:
-                stats = self.calculate_column_stats(df, column)
-                column_stats.append(stats)
+                return self.calculate_column_stats(
+                    df, column, numeric_summaries.get(column), null_counts[column]
+                )
             except Exception as e:
                 print(f"Error profiling column {column}: {e}")
                 # Create minimal stats on error
-                column_stats.append(ColumnStats(
+                return ColumnStats.model_construct(
                     column_name=column,
                     data_type="unknown",
                     null_count=0,
@@ -694,19 +1367,37 @@ class CSVProfiler:
                     unique_percentage=0.0,
                     duplicate_count=0,
                     top_values=[]
-                ))
+                )
         
-        # Get file size
-        file_size = file_path.stat().st_size
+        max_workers = min(self.max_workers, len(columns_to_profile))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                column_stats = list(executor.map(profile_column, columns_to_profile))
+        else:
+            column_stats = [profile_column(column) for column in columns_to_profile]
         
         # Calculate profiling duration
-        profiling_duration = (datetime.now() - start_time).total_seconds()
+        profiling_duration = time.perf_counter() - start_time
+        profiled_at = datetime.now()
         
         # Apply Dataset-Level Rules
-        dataset_statistics = self.calculate_dataset_statistics(df, file_size, profiling_duration)
-        dataset_quality = self.calculate_dataset_quality(df, column_stats)
-        referential_integrity = self.analyze_referential_integrity(df)
-        candidate_keys = self.discover_candidate_keys(df)
+        dataset_statistics = self.calculate_dataset_statistics(df, file_size, profiling_duration, profiled_at)
+        dataset_quality = self.calculate_dataset_quality(df, column_stats, null_counts)
+        distinct_counts = {
+            stats.column_name: stats.unique_count + (1 if null_counts[stats.column_name] > 0 else 0)
+            for stats in column_stats if stats.data_type != "unknown"
+        }
+        if self.max_workers > 1:
+            # The two cross-column rules are independent; run integrity checks alongside the key search
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                integrity_future = executor.submit(
+                    self.analyze_referential_integrity, df, null_counts, distinct_counts
+                )
+                candidate_keys = self.discover_candidate_keys(df, null_counts, distinct_counts)
+                referential_integrity = integrity_future.result()
+        else:
+            referential_integrity = self.analyze_referential_integrity(df, null_counts, distinct_counts)
+            candidate_keys = self.discover_candidate_keys(df, null_counts, distinct_counts)
         
         return DatasetProfile(
             dataset_name=dataset_name,
@@ -714,7 +1405,7 @@ class CSVProfiler:
             column_count=len(df.columns),
             file_size_bytes=file_size,
             columns=column_stats,
-            profiled_at=datetime.now(),
+            profiled_at=profiled_at,
             dataset_statistics=dataset_statistics,
             dataset_quality=dataset_quality,
             referential_integrity=referential_integrity,